@@ -1,6 +1,9 @@
 """Backup operations for Vintage Story Server Manager."""
 
+import io
+import os
 import shutil
+import subprocess
 import tarfile
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +17,12 @@ from .config import (
 )
 from .server import command
 
+# Tar stream buffer, so the archive is written in large blocks
+TAR_STREAM_BUFSIZE = 1024 * 1024
+
+# Write buffer for the compressed output file
+OUTPUT_BUFSIZE = 4 * 1024 * 1024
+
 
 def world_backup(config: dict | None = None) -> str:
     """Create a world backup using the server's genbackup command."""
@@ -43,13 +52,72 @@ def server_backup(config: dict | None = None) -> str:
     backup_filename = f"backup-{timestamp}.tar.gz"
     backup_path = backups_path / backup_filename
 
-    # Create tar.gz archive
-    with tarfile.open(backup_path, "w:gz") as tar:
-        tar.add(data_path, arcname=data_path.name)
+    # Create tar.gz archive, using pigz for multi-core compression if available
+    pigz = shutil.which("pigz")
+    if pigz:
+        _archive_with_pigz(pigz, data_path, backup_path)
+    else:
+        _archive_with_tarfile(data_path, backup_path)
 
     return f"Server backup created: {backup_path}"
 
 
+def _archive_with_tarfile(data_path: Path, backup_path: Path) -> None:
+    """Write a gzipped tar archive of data_path using the tarfile module."""
+    raw = open(backup_path, "wb", buffering=0)
+    try:
+        with io.BufferedWriter(raw, buffer_size=OUTPUT_BUFSIZE) as out_file:
+            with tarfile.open(
+                fileobj=out_file, mode="w|gz", bufsize=TAR_STREAM_BUFSIZE
+            ) as tar:
+                tar.add(data_path, arcname=data_path.name)
+            out_file.flush()
+            os.fsync(raw.fileno())
+    except Exception:
+        # Never leave a truncated archive for listing and pruning to count
+        backup_path.unlink(missing_ok=True)
+        raise
+
+
+def _archive_with_pigz(pigz: str, data_path: Path, backup_path: Path) -> None:
+    """
+    Stream a tar archive of data_path through pigz into backup_path.
+
+    Python only writes the uncompressed tar stream; gzip compression happens in
+    the pigz process across all cores. The output is a regular .tar.gz file.
+    """
+    broken_pipe = False
+    with open(backup_path, "wb") as out_file:
+        proc = subprocess.Popen([pigz, "-c"], stdin=subprocess.PIPE, stdout=out_file)
+        try:
+            try:
+                with tarfile.open(
+                    fileobj=proc.stdin, mode="w|", bufsize=TAR_STREAM_BUFSIZE
+                ) as tar:
+                    tar.add(data_path, arcname=data_path.name)
+            except BrokenPipeError:
+                # pigz died mid-stream (ENOSPC, killed); report its status below
+                broken_pipe = True
+            except Exception:
+                proc.kill()
+                backup_path.unlink(missing_ok=True)
+                raise
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    broken_pipe = True
+        finally:
+            # Always reap pigz, even if closing its stdin failed
+            returncode = proc.wait()
+        if returncode == 0 and not broken_pipe:
+            os.fsync(out_file.fileno())
+
+    if returncode != 0 or broken_pipe:
+        backup_path.unlink(missing_ok=True)
+        raise RuntimeError(f"pigz exited with status {returncode}")
+
+
 def cleanup_after_server_backup(config: dict | None = None) -> str:
     """
     Clean up world backups and logs folders after a server backup.
@@ -64,21 +132,23 @@ def cleanup_after_server_backup(config: dict | None = None) -> str:
     # Clear world backups folder
     world_backups = get_world_backups_path(config)
     if world_backups.exists():
-        for item in world_backups.iterdir():
-            if item.is_file():
-                item.unlink()
-            elif item.is_dir():
-                shutil.rmtree(item)
+        with os.scandir(world_backups) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
         messages.append(f"Cleared world backups: {world_backups}")
 
     # Clear logs folder (but keep Archive structure)
     logs_path = get_logs_path(config)
     if logs_path.exists():
-        for item in logs_path.iterdir():
-            # Keep the Archive folder itself but clear non-archive log files
-            if item.is_file():
-                item.unlink()
-                messages.append(f"Removed log file: {item.name}")
+        with os.scandir(logs_path) as it:
+            for entry in it:
+                # Keep the Archive folder itself but clear non-archive log files
+                if entry.is_file():
+                    os.unlink(entry.path)
+                    messages.append(f"Removed log file: {entry.name}")
 
     return "\n".join(messages) if messages else "Nothing to clean up"
 
@@ -97,11 +167,7 @@ def prune_old_backups(config: dict | None = None) -> str:
         return "No backups directory found"
 
     # Get all backup files sorted by modification time (newest first)
-    backups = sorted(
-        backups_path.glob("backup-*.tar.gz"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    backups = _sorted_backup_entries(backups_path)
 
     if len(backups) <= max_backups:
         return f"No pruning needed ({len(backups)}/{max_backups} backups)"
@@ -109,7 +175,7 @@ def prune_old_backups(config: dict | None = None) -> str:
     # Remove old backups
     removed = []
     for backup in backups[max_backups:]:
-        backup.unlink()
+        os.unlink(backup.path)
         removed.append(backup.name)
 
     return f"Pruned {len(removed)} old backup(s): {', '.join(removed)}"
@@ -125,8 +191,23 @@ def list_backups(config: dict | None = None) -> list[Path]:
     if not backups_path.exists():
         return []
 
-    return sorted(
-        backups_path.glob("backup-*.tar.gz"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    return [Path(entry.path) for entry in _sorted_backup_entries(backups_path)]
+
+
+def _sorted_backup_entries(backups_path: Path) -> list[os.DirEntry]:
+    """
+    Get server backup entries sorted by modification time (newest first).
+
+    Uses a single scandir pass; the sort key reads the DirEntry's cached stat.
+    """
+    with os.scandir(backups_path) as it:
+        entries = [
+            entry
+            for entry in it
+            if entry.name.startswith("backup-")
+            and entry.name.endswith(".tar.gz")
+            and entry.is_file()
+        ]
+
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    return entries
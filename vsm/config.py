@@ -1,6 +1,7 @@
 """Configuration management for Vintage Story Server Manager."""
 
 import json
+import os
 from pathlib import Path
 
 DEFAULT_CONFIG = {
@@ -11,6 +12,9 @@ DEFAULT_CONFIG = {
     "max_server_backups": 7,
 }
 
+# Last parsed config, keyed on (path, mtime_ns, size) of config.json
+_config_cache: tuple[tuple, dict] | None = None
+
 
 def get_config_path() -> Path:
     """Get the path to the config file (same directory as the package)."""
@@ -18,27 +22,54 @@ def get_config_path() -> Path:
 
 
 def load_config() -> dict:
-    """Load configuration from config.json, creating with defaults if missing."""
+    """
+    Load configuration from config.json, creating with defaults if missing.
+
+    The parsed config is cached and only re-read when the file's mtime or size
+    changes. Callers always receive their own copy.
+    """
+    global _config_cache
+
     config_path = get_config_path()
 
-    if not config_path.exists():
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         save_config(DEFAULT_CONFIG)
         return DEFAULT_CONFIG.copy()
 
+    cache_key = (config_path, st.st_mtime_ns, st.st_size)
+    if _config_cache is not None and _config_cache[0] == cache_key:
+        return _config_cache[1].copy()
+
     with open(config_path, "r") as f:
         config = json.load(f)
 
     # Merge with defaults for any missing keys
     merged = DEFAULT_CONFIG.copy()
     merged.update(config)
-    return merged
+
+    _config_cache = (cache_key, merged)
+    return merged.copy()
 
 
 def save_config(config: dict) -> None:
-    """Save configuration to config.json."""
+    """
+    Save configuration to config.json.
+
+    Writes to a temporary file and renames it over config.json, so readers
+    never see a partially written file.
+    """
+    global _config_cache
+
     config_path = get_config_path()
-    with open(config_path, "w") as f:
+    tmp_path = config_path.with_suffix(".json.tmp")
+    _config_cache = None
+    with open(tmp_path, "w") as f:
         json.dump(config, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, config_path)
 
 
 def get_data_path(config: dict) -> Path:
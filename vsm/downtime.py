@@ -1,6 +1,9 @@
 """Downtime tracking for Vintage Story Server Manager."""
 
 import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -8,6 +11,17 @@ from .config import get_server_backups_path, load_config
 
 DOWNTIME_FILENAME = ".downtime"
 
+# In-memory copy of the downtime file. _state_key is (path, mtime_ns) of the
+# file the state was read from or last written to; while writes are pending the
+# in-memory state is newer than the file and is used as-is.
+_lock = threading.Lock()
+_state: dict | None = None
+_state_key: tuple[Path, int | None] | None = None
+_pending_writes = 0
+
+# Single writer thread so saves are applied in order
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vsm-downtime")
+
 
 def _get_downtime_file(config: dict) -> Path:
     """Get the path to the downtime tracking file."""
@@ -17,39 +31,93 @@ def _get_downtime_file(config: dict) -> Path:
 
 
 def _load_downtime_data(config: dict) -> dict:
-    """Load downtime data from file."""
+    """Load downtime data, only re-reading the file if it changed on disk."""
+    global _state, _state_key
+
     downtime_file = _get_downtime_file(config)
 
-    if not downtime_file.exists():
-        return {}
+    with _lock:
+        if _state is not None and _state_key[0] == downtime_file:
+            if _pending_writes:
+                return dict(_state)
+
+        try:
+            mtime = os.stat(downtime_file).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if _state is None or _state_key != (downtime_file, mtime):
+            if mtime is None:
+                _state = {}
+            else:
+                with open(downtime_file, "r") as f:
+                    _state = json.load(f)
+            _state_key = (downtime_file, mtime)
 
-    with open(downtime_file, "r") as f:
-        return json.load(f)
+        return dict(_state)
 
 
-def _save_downtime_data(config: dict, data: dict) -> None:
-    """Save downtime data to file."""
+def _save_downtime_data(config: dict, data: dict) -> Future:
+    """
+    Update the in-memory downtime data and write it to file in the background.
+
+    Returns the future for the write, which holds the OSError if it failed.
+    """
+    global _state, _state_key, _pending_writes
+
     downtime_file = _get_downtime_file(config)
 
-    with open(downtime_file, "w") as f:
-        json.dump(data, f, indent=2)
+    with _lock:
+        _state = dict(data)
+        _state_key = (downtime_file, None)
+        _pending_writes += 1
 
+    return _writer.submit(_write_downtime_file, downtime_file, dict(data))
 
-def record_stop_time(config: dict | None = None) -> None:
-    """Record the timestamp when server stop begins."""
+
+def _write_downtime_file(downtime_file: Path, data: dict) -> None:
+    """Atomically write downtime data via a temp file and rename."""
+    global _state, _state_key, _pending_writes
+
+    try:
+        tmp_file = downtime_file.with_name(downtime_file.name + ".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, downtime_file)
+        mtime = os.stat(downtime_file).st_mtime_ns
+    except OSError:
+        with _lock:
+            _pending_writes -= 1
+            # Re-read whatever is on disk next time
+            _state = None
+        raise
+
+    with _lock:
+        _pending_writes -= 1
+        if not _pending_writes and _state_key == (downtime_file, None):
+            _state_key = (downtime_file, mtime)
+
+
+def record_stop_time(config: dict | None = None) -> Future:
+    """
+    Record the timestamp when server stop begins.
+
+    Returns the future for the background write of the downtime file.
+    """
     if config is None:
         config = load_config()
 
     data = _load_downtime_data(config)
     data["stop_time"] = datetime.now().isoformat()
-    _save_downtime_data(config, data)
+    return _save_downtime_data(config, data)
 
 
-def record_start_time(config: dict | None = None) -> None:
+def record_start_time(config: dict | None = None) -> Future:
     """
     Record the timestamp when server is back online and calculate downtime.
 
-    This should be called after the server has fully started.
+    This should be called after the server has fully started. Returns the
+    future for the background write of the downtime file.
     """
     if config is None:
         config = load_config()
@@ -64,7 +132,7 @@ def record_start_time(config: dict | None = None) -> None:
         downtime_seconds = (start_time - stop_time).total_seconds()
         data["last_downtime_seconds"] = downtime_seconds
 
-    _save_downtime_data(config, data)
+    return _save_downtime_data(config, data)
 
 
 def get_estimated_downtime(config: dict | None = None) -> int | None:
@@ -1,28 +1,63 @@
 """Log viewer functionality for Vintage Story Server Manager."""
 
+import io
+import os
+import re
 import subprocess
 import sys
 import time
+from collections.abc import Iterator
+from operator import attrgetter
 from pathlib import Path
+from typing import BinaryIO
 
 from rich.console import Console
+from rich.markup import escape
 from rich.prompt import Prompt
 
 from .config import get_logs_path, load_config
 
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
 console = Console()
 
+# Seconds between checks when file change notifications are unavailable
+POLL_INTERVAL = 0.5
+
+# Bytes requested per read() when tailing a log file
+READ_CHUNK_SIZE = 64 * 1024
+
+# Write buffer for the pipe into the pager
+PAGER_BUFSIZE = 1024 * 1024
+
+# Status block markers written to server-main by server.sh status, matched
+# case-insensitively in a single scan without lowercasing each line
+_BLOCK_START = "is up and running"
+_BLOCK_END = "memory usage managed/total:"
+_SINGLE_STATUS = "is not running"
+_STATUS_MARKER_RE = re.compile(
+    "|".join(re.escape(m) for m in (_BLOCK_START, _BLOCK_END, _SINGLE_STATUS)),
+    re.IGNORECASE,
+)
+
+# Archive folder entry counts keyed by path: (mtime_ns, count)
+_entry_count_cache: dict[Path, tuple[int, int]] = {}
+
 
 def _get_active_log_files(logs_path: Path) -> list[Path]:
-    """Get list of active (non-archived) log files."""
+    """Get list of active (non-archived) log files, newest first."""
     if not logs_path.exists():
         return []
 
-    return sorted(
-        [f for f in logs_path.iterdir() if f.is_file() and f.suffix == ".txt"],
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    with os.scandir(logs_path) as it:
+        entries = [
+            entry for entry in it if entry.is_file() and entry.name.endswith(".txt")
+        ]
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    return [Path(entry.path) for entry in entries]
 
 
 def _get_archive_folders(logs_path: Path) -> list[Path]:
@@ -31,19 +66,285 @@ def _get_archive_folders(logs_path: Path) -> list[Path]:
     if not archive_path.exists():
         return []
 
-    return sorted(
-        [d for d in archive_path.iterdir() if d.is_dir()],
-        key=lambda p: p.name,
-        reverse=True,
-    )
+    with os.scandir(archive_path) as it:
+        entries = [entry for entry in it if entry.is_dir()]
+    entries.sort(key=attrgetter("name"), reverse=True)
+    return [Path(entry.path) for entry in entries]
+
+
+def _get_log_files_in_folder(folder: Path) -> list[os.DirEntry]:
+    """Get log file entries in a specific folder, sorted by name."""
+    with os.scandir(folder) as it:
+        entries = [entry for entry in it if entry.is_file()]
+    entries.sort(key=attrgetter("name"))
+    return entries
+
+
+def _count_entries(folder: Path) -> int:
+    """
+    Count the entries in a folder without building a list of them.
+
+    Counts are cached against the folder's mtime, which changes whenever an
+    entry is added or removed, so redrawing the archive menu only rescans
+    folders that actually changed.
+    """
+    mtime_ns = os.stat(folder).st_mtime_ns
+    cached = _entry_count_cache.get(folder)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with os.scandir(folder) as it:
+        count = sum(1 for _ in it)
+    _entry_count_cache[folder] = (mtime_ns, count)
+    return count
+
+
+def _open_log_file(log_file: Path) -> BinaryIO | None:
+    """Open a log file for tailing, or return None if it no longer exists."""
+    try:
+        return open(log_file, "rb", buffering=0)
+    except FileNotFoundError:
+        return None
+
+
+def _read_new_lines(f: BinaryIO, pending: bytearray) -> list[str]:
+    """
+    Read everything appended to a log file and return the complete new lines.
+
+    Raw bytes collect in pending, where a trailing partial line waits until the
+    rest of it is written. Only complete lines are decoded.
+    """
+    while chunk := f.read(READ_CHUNK_SIZE):
+        pending += chunk
+
+    end = pending.rfind(b"\n")
+    if end < 0:
+        return []
+
+    lines = [
+        line.decode("utf-8", "replace").rstrip("\r")
+        for line in pending[:end].split(b"\n")
+    ]
+    del pending[: end + 1]
+    return lines
+
+
+class _StatusBlockFilter:
+    """Drop the status blocks that server.sh status writes to server-main."""
+
+    def __init__(self) -> None:
+        self.in_block = False
+
+    def keep(self, line: str) -> bool:
+        """Feed the next line and return whether it should be shown."""
+        match = _STATUS_MARKER_RE.search(line)
+        marker = match.group(0).lower() if match else None
+
+        if self.in_block:
+            if marker == _BLOCK_END:
+                self.in_block = False
+            return False  # Line is inside block, discard
+
+        if marker == _BLOCK_START:
+            self.in_block = True
+            return False  # Start of block, discard
+
+        return marker != _SINGLE_STATUS  # Discard single-line status
+
+
+def _line_prefix(log_file: Path) -> str:
+    """Build the markup prefix shown before each line tailed from a file."""
+    return f"[cyan]{escape(f'[{log_file.stem}]')}[/cyan] "
+
+
+def _print_new_lines(
+    f: BinaryIO,
+    pending: bytearray,
+    prefix: str,
+    status_filter: _StatusBlockFilter | None,
+) -> None:
+    """Print the complete lines appended to a tailed log file since last read."""
+    # read() returns b"" at EOF, so no size check is needed
+    new_lines = _read_new_lines(f, pending)
+    if not new_lines:
+        return
 
+    # Render everything read this wake in one print call; log text is escaped
+    # so brackets in it are not parsed as markup
+    out_lines = [
+        f"{prefix}{escape(line)}"
+        for line in new_lines
+        if status_filter is None or status_filter.keep(line)
+    ]
+    if out_lines:
+        console.print("\n".join(out_lines))
 
-def _get_log_files_in_folder(folder: Path) -> list[Path]:
-    """Get log files in a specific folder."""
-    return sorted(
-        [f for f in folder.iterdir() if f.is_file()],
-        key=lambda p: p.name,
-    )
+
+def _new_status_filter(log_file: Path) -> _StatusBlockFilter | None:
+    """Get a status block filter for server-main logs, None for other logs."""
+    if log_file.stem == "server-main":
+        return _StatusBlockFilter()
+    return None
+
+
+class _Watcher:
+    """
+    Wait for changes to the active log files in a logs directory.
+
+    Uses a single inotify instance on Linux when inotify_simple is installed:
+    one watch on the directory picks up new and rotated log files, and one
+    watch per file reports new content, so an idle log costs no syscalls.
+    Otherwise, or if inotify cannot be set up, falls back to polling every
+    POLL_INTERVAL seconds, rescanning the directory and reporting every file as
+    possibly changed.
+
+    A log file replaced under the same name is reported as removed and added,
+    so callers should handle removals first.
+    """
+
+    def __init__(self, logs_path: Path, paths: list[Path]) -> None:
+        self._logs_path = logs_path
+        self._paths: set[Path] = set(paths)
+        self._inotify = None
+        self._dir_wd: int | None = None
+        self._wd_paths: dict[int, Path] = {}
+        self._path_wds: dict[Path, int] = {}
+        self._inodes: dict[Path, int] = {}
+
+        if INotify is not None and sys.platform.startswith("linux"):
+            self._start_inotify()
+        if self._inotify is not None:
+            for path in paths:
+                self._add_file_watch(path)
+        else:
+            self._inodes = {
+                path: inode
+                for path, inode in self._scan().items()
+                if path in self._paths
+            }
+
+    def _start_inotify(self) -> None:
+        """Watch the logs directory, leaving _inotify unset if that fails."""
+        try:
+            inotify = INotify()
+        except OSError:
+            return  # e.g. the per-user instance limit is reached
+        # Only subscribe to the events acted on in wait(), so readers opening
+        # or scanning the logs (ACCESS/OPEN) never fill the inotify queue
+        try:
+            self._dir_wd = inotify.add_watch(
+                str(self._logs_path),
+                flags.CREATE | flags.MOVED_TO | flags.MOVED_FROM | flags.DELETE,
+            )
+        except OSError:
+            inotify.close()
+            return
+        self._inotify = inotify
+
+    def _add_file_watch(self, path: Path) -> None:
+        """Start watching a log file for new content."""
+        try:
+            wd = self._inotify.add_watch(
+                str(path), flags.MODIFY | flags.MOVE_SELF | flags.CLOSE_WRITE
+            )
+        except OSError:
+            return  # File disappeared before it could be watched
+        self._wd_paths[wd] = path
+        self._path_wds[path] = wd
+
+    def _remove_file_watch(self, path: Path) -> None:
+        """Stop watching a log file."""
+        wd = self._path_wds.pop(path, None)
+        if wd is None:
+            return
+        self._wd_paths.pop(wd, None)
+        try:
+            self._inotify.rm_watch(wd)
+        except OSError:
+            pass  # Watch was already removed by the kernel
+
+    def wait(self) -> tuple[list[Path], list[Path], list[Path]]:
+        """
+        Block until something changes.
+
+        Returns (changed, added, removed): files that may have new content, log
+        files that appeared, and log files that went away. Added files are also
+        reported as changed.
+        """
+        if self._inotify is None:
+            return self._poll()
+
+        changed: list[Path] = []
+        added: list[Path] = []
+        removed: list[Path] = []
+
+        for event in self._inotify.read():
+            if event.wd == self._dir_wd:
+                if event.mask & flags.ISDIR or not event.name.endswith(".txt"):
+                    continue
+                path = self._logs_path / event.name
+                if event.mask & (flags.CREATE | flags.MOVED_TO):
+                    # A tracked name created or moved onto again is a new file
+                    # (e.g. an atomic rotation), so drop the old inode's watch
+                    if path in self._paths:
+                        self._remove_file_watch(path)
+                        removed.append(path)
+                    self._paths.add(path)
+                    self._add_file_watch(path)
+                    if path not in added:
+                        added.append(path)
+                    if path not in changed:
+                        changed.append(path)
+                elif path in self._paths:
+                    self._paths.discard(path)
+                    self._remove_file_watch(path)
+                    removed.append(path)
+                    if path in changed:
+                        changed.remove(path)
+                continue
+
+            if event.mask & flags.IGNORED:
+                path = self._wd_paths.pop(event.wd, None)
+                if path is not None:
+                    self._path_wds.pop(path, None)
+                continue
+
+            path = self._wd_paths.get(event.wd)
+            if path is not None and path not in changed:
+                changed.append(path)
+
+        return changed, added, removed
+
+    def _poll(self) -> tuple[list[Path], list[Path], list[Path]]:
+        """Sleep for one poll interval, then rescan the logs directory."""
+        time.sleep(POLL_INTERVAL)
+        current = self._scan()
+        added = [
+            path for path, inode in current.items() if self._inodes.get(path) != inode
+        ]
+        removed = [
+            path for path, inode in self._inodes.items() if current.get(path) != inode
+        ]
+        self._inodes = current
+        return list(current), added, removed
+
+    def _scan(self) -> dict[Path, int]:
+        """Map each active log file to its inode, read from the cached dirent."""
+        try:
+            with os.scandir(self._logs_path) as it:
+                return {
+                    Path(entry.path): entry.inode()
+                    for entry in it
+                    if entry.name.endswith(".txt") and entry.is_file()
+                }
+        except FileNotFoundError:
+            return {}
+
+    def close(self) -> None:
+        """Release the inotify instance, if any."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
 
 
 def tail_live(config: dict | None = None) -> None:
@@ -65,60 +366,70 @@ def tail_live(config: dict | None = None) -> None:
     console.print(f"[bold]Tailing {len(log_files)} log file(s)[/bold]")
     console.print("Press Ctrl+C to stop\n")
 
-    # Track file positions and state for each file
-    file_positions: dict[Path, int] = {}
-    in_block_states: dict[Path, bool] = {}
+    # Keep one open handle per file for the whole session, like tail -f
+    file_handles: dict[Path, BinaryIO] = {}
+    pending_bytes: dict[Path, bytearray] = {}
+    status_filters: dict[Path, _StatusBlockFilter | None] = {}
+    # Per-file "[name] " markup, built once when the file is opened
+    prefixes: dict[Path, str] = {}
 
     for log_file in log_files:
-        file_positions[log_file] = log_file.stat().st_size
-        in_block_states[log_file] = False
+        f = _open_log_file(log_file)
+        if f is None:
+            continue
+        f.seek(0, io.SEEK_END)
+        file_handles[log_file] = f
+        pending_bytes[log_file] = bytearray()
+        status_filters[log_file] = _new_status_filter(log_file)
+        prefixes[log_file] = _line_prefix(log_file)
         console.print(f"[dim]Watching: {log_file.name}[/dim]")
 
     console.print()
 
+    watcher = _Watcher(logs_path, log_files)
+
     try:
         while True:
-            for log_file in log_files:
-                if not log_file.exists():
+            changed, added, removed = watcher.wait()
+
+            for log_file in removed:
+                f = file_handles.pop(log_file, None)
+                pending = pending_bytes.pop(log_file, None)
+                status_filter = status_filters.pop(log_file, None)
+                prefix = prefixes.pop(log_file, None)
+                if f is not None:
+                    # Show what was written just before a rotation, since the
+                    # old inode's handle is about to be dropped
+                    _print_new_lines(f, pending, prefix, status_filter)
+                    f.close()
+
+            # Newly created or rotated-in files are read from the start
+            for log_file in added:
+                f = _open_log_file(log_file)
+                if f is None:
                     continue
-
-                current_size = log_file.stat().st_size
-                last_pos = file_positions.get(log_file, 0)
-
-                if current_size > last_pos:
-                    with open(log_file, "r", encoding="utf-8", errors="replace") as f:
-                        f.seek(last_pos)
-                        new_content = f.read()
-                        if new_content:
-                            prefix = f"[cyan][{log_file.stem}][/cyan] "
-                            is_server_main = log_file.stem == "server-main"
-
-                            for line in new_content.splitlines():
-                                if not is_server_main:
-                                    console.print(f"{prefix}{line}")
-                                    continue
-
-                                # State machine for server-main.log
-                                line_lower = line.lower()
-                                in_block = in_block_states[log_file]
-
-                                if in_block:
-                                    if "memory usage managed/total:" in line_lower:
-                                        in_block_states[log_file] = False
-                                    # Discard line
-                                elif "is up and running" in line_lower:
-                                    in_block_states[log_file] = True
-                                    # Discard line
-                                elif "is not running" in line_lower:
-                                    # Discard single-line status
-                                    pass
-                                else:
-                                    console.print(f"{prefix}{line}")
-
-                    file_positions[log_file] = current_size
-            time.sleep(0.5)
+                file_handles[log_file] = f
+                pending_bytes[log_file] = bytearray()
+                status_filters[log_file] = _new_status_filter(log_file)
+                prefixes[log_file] = _line_prefix(log_file)
+                console.print(f"[dim]Watching: {log_file.name}[/dim]")
+
+            for log_file in changed:
+                f = file_handles.get(log_file)
+                if f is None:
+                    continue
+                _print_new_lines(
+                    f,
+                    pending_bytes[log_file],
+                    prefixes[log_file],
+                    status_filters[log_file],
+                )
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopped tailing logs[/yellow]")
+    finally:
+        watcher.close()
+        for f in file_handles.values():
+            f.close()
 
 
 def browse_archives(config: dict | None = None) -> None:
@@ -139,91 +450,89 @@ def browse_archives(config: dict | None = None) -> None:
         )
         return
 
-    # Display archive folders
-    console.print("[bold]Archived Log Sessions[/bold]\n")
-    for i, folder in enumerate(archive_folders, 1):
-        file_count = len(list(folder.iterdir()))
-        console.print(f"  {i}. {folder.name} ({file_count} files)")
+    while True:
+        # Display archive folders
+        console.print("[bold]Archived Log Sessions[/bold]\n")
+        for i, folder in enumerate(archive_folders, 1):
+            file_count = _count_entries(folder)
+            console.print(f"  {i}. {folder.name} ({file_count} files)")
 
-    console.print(f"  0. Cancel\n")
+        console.print(f"  0. Cancel\n")
 
-    # Get folder selection
-    choice = Prompt.ask("Select session", default="0")
+        # Get folder selection
+        choice = Prompt.ask("Select session", default="0")
 
-    try:
-        choice_num = int(choice)
-        if choice_num == 0:
-            return
-        if choice_num < 1 or choice_num > len(archive_folders):
-            console.print("[red]Invalid selection[/red]")
+        try:
+            choice_num = int(choice)
+            if choice_num == 0:
+                return
+            if choice_num < 1 or choice_num > len(archive_folders):
+                console.print("[red]Invalid selection[/red]")
+                return
+
+            selected_folder = archive_folders[choice_num - 1]
+
+        except ValueError:
+            console.print("[red]Invalid input[/red]")
             return
 
-        selected_folder = archive_folders[choice_num - 1]
+        # Display files in selected folder
+        log_files = _get_log_files_in_folder(selected_folder)
 
-    except ValueError:
-        console.print("[red]Invalid input[/red]")
-        return
+        if not log_files:
+            console.print(f"[yellow]No log files in {selected_folder.name}[/yellow]")
+            return
 
-    # Display files in selected folder
-    log_files = _get_log_files_in_folder(selected_folder)
+        console.print(f"\n[bold]Log Files in {selected_folder.name}[/bold]\n")
+        for i, log_file in enumerate(log_files, 1):
+            # DirEntry.stat() is cached on the entry
+            size_kb = log_file.stat().st_size / 1024
+            console.print(f"  {i}. {log_file.name} ({size_kb:.1f} KB)")
 
-    if not log_files:
-        console.print(f"[yellow]No log files in {selected_folder.name}[/yellow]")
-        return
+        console.print(f"  0. Back\n")
 
-    console.print(f"\n[bold]Log Files in {selected_folder.name}[/bold]\n")
-    for i, log_file in enumerate(log_files, 1):
-        size_kb = log_file.stat().st_size / 1024
-        console.print(f"  {i}. {log_file.name} ({size_kb:.1f} KB)")
+        # Get file selection
+        file_choice = Prompt.ask("Select file", default="0")
 
-    console.print(f"  0. Back\n")
+        try:
+            file_choice_num = int(file_choice)
+            if file_choice_num == 0:
+                continue  # Go back to folder selection
+            if file_choice_num < 1 or file_choice_num > len(log_files):
+                console.print("[red]Invalid selection[/red]")
+                return
 
-    # Get file selection
-    file_choice = Prompt.ask("Select file", default="0")
+            selected_file = log_files[file_choice_num - 1]
 
-    try:
-        file_choice_num = int(file_choice)
-        if file_choice_num == 0:
-            return browse_archives(config)  # Go back to folder selection
-        if file_choice_num < 1 or file_choice_num > len(log_files):
-            console.print("[red]Invalid selection[/red]")
+        except ValueError:
+            console.print("[red]Invalid input[/red]")
             return
 
-        selected_file = log_files[file_choice_num - 1]
-
-    except ValueError:
-        console.print("[red]Invalid input[/red]")
-        return
+        break
 
     # View the selected file using system pager
-    view_file(selected_file)
+    view_file(Path(selected_file.path))
 
 
-def view_file(file_path: Path) -> None:
-    """View a file using the system pager or less, filtering status blocks."""
+def _iter_log_lines(file_path: Path) -> Iterator[str]:
+    """Yield the lines of a log file, filtering status blocks from server-main."""
     with open(file_path, "r", encoding="utf-8", errors="replace") as f:
         if file_path.stem == "server-main":
-            lines = f.readlines()
-            filtered_lines = []
-            in_block = False
-            for line in lines:
-                line_lower = line.lower()
-                if "is up and running" in line_lower:
-                    in_block = True
-                    continue  # Start of block, discard
-                if "is not running" in line_lower:
-                    continue  # Single line block, discard
-
-                if in_block:
-                    if "memory usage managed/total:" in line_lower:
-                        in_block = False
-                    continue  # Line is inside block, discard
-
-                filtered_lines.append(line)
-            content = "".join(filtered_lines)
+            status_filter = _StatusBlockFilter()
+            for line in f:
+                if status_filter.keep(line):
+                    yield line
         else:
-            content = f.read()
+            yield from f
 
+
+def view_file(file_path: Path) -> None:
+    """
+    View a file using the system pager or less, filtering status blocks.
+
+    Lines are streamed into the pager as they are read, so memory use does not
+    grow with the size of the file.
+    """
     pager_cmd = []
     if sys.platform == "win32":
         pager_cmd = ["more"]
@@ -231,7 +540,21 @@ def view_file(file_path: Path) -> None:
         pager_cmd = ["less", "-R"]
 
     try:
-        process = subprocess.Popen(pager_cmd, stdin=subprocess.PIPE, text=True)
-        process.communicate(input=content)
-    except (FileNotFoundError, Exception):
-        console.print(content)
+        process = subprocess.Popen(
+            pager_cmd, stdin=subprocess.PIPE, text=True, bufsize=PAGER_BUFSIZE
+        )
+    except Exception:
+        console.print("".join(_iter_log_lines(file_path)))
+        return
+
+    try:
+        for line in _iter_log_lines(file_path):
+            process.stdin.write(line)
+    except BrokenPipeError:
+        pass  # Pager was closed before the whole file was shown
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+    process.wait()
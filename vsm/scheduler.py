@@ -1,11 +1,14 @@
 """Backup scheduling with announcements for Vintage Story Server Manager."""
 
+import fcntl
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
-
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from .backup import (
     cleanup_after_server_backup,
@@ -13,7 +16,7 @@ from .backup import (
     server_backup,
     world_backup,
 )
-from .config import load_config
+from .config import get_server_backups_path, load_config
 from .downtime import (
     format_downtime_estimate,
     record_start_time,
@@ -21,9 +24,28 @@ from .downtime import (
 )
 from .server import announce, get_players, start, stop
 
-# Announcement intervals in minutes before backup
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+# Announcement intervals in minutes before backup (each under an hour)
 ANNOUNCEMENT_INTERVALS = [30, 15, 10, 5, 2, 1]
 
+# Seconds a fetched player count is reused for announcement checks; longer
+# than the 60s gap between the 2m and 1m announcements so they share a lookup
+PLAYER_COUNT_TTL = 90
+
+# Seconds a backup job may start late (e.g. after host suspend) and still run
+BACKUP_MISFIRE_GRACE_TIME = 15 * 60
+
+# Lock file (in the server backups directory) held while a scheduler is running
+LOCK_FILENAME = ".scheduler.lock"
+
+
+@lru_cache(maxsize=32)
+def _backup_hours(interval: int) -> tuple[int, ...]:
+    """Get the sorted hours a cron hour="*/interval" trigger fires on."""
+    return tuple(range(0, 24, interval))
+
 
 class SchedulerState(Enum):
     """Scheduler state enum."""
@@ -41,6 +63,13 @@ class VSMScheduler:
         self._scheduler: BackgroundScheduler | None = None
         self._config: dict | None = None
         self._log_callback: Any = None
+        self._lock_fd: int | None = None
+        # Guards _draining, which is set while a stopped scheduler finishes its
+        # running jobs on a background thread and still holds the lock
+        self._state_lock = threading.Lock()
+        self._draining = False
+        self._server_backup_hours: tuple[int, ...] = ()
+        self._player_count: tuple[float, int] | None = None
 
     @classmethod
     def get_instance(cls) -> "VSMScheduler":
@@ -73,17 +102,14 @@ class VSMScheduler:
 
         jobs = []
         for job in self._scheduler.get_jobs():
-            job_info = {
-                "id": job.id,
-                "name": job.name,
-                "next_run_time": job.next_run_time,
-            }
-            # Get trigger info
-            if hasattr(job.trigger, "__str__"):
-                job_info["trigger"] = str(job.trigger)
-            else:
-                job_info["trigger"] = "unknown"
-            jobs.append(job_info)
+            jobs.append(
+                {
+                    "id": job.id,
+                    "name": job.name,
+                    "next_run_time": job.next_run_time,
+                    "trigger": str(job.trigger),
+                }
+            )
         return jobs
 
     def start(self, config: dict | None = None) -> None:
@@ -95,17 +121,44 @@ class VSMScheduler:
             config = load_config()
         self._config = config
 
+        with self._state_lock:
+            if self._draining:
+                raise RuntimeError(
+                    "The previous scheduler is still finishing a running backup"
+                )
+            # Only one scheduler may run backups against the same server
+            self._acquire_lock(config)
+
+        try:
+            self._start_jobs(config)
+        except Exception:
+            self._scheduler = None
+            self._release_lock()
+            raise
+        self._log("Scheduler started")
+
+    def _start_jobs(self, config: dict) -> None:
+        """Create the APScheduler instance, add the backup jobs and start it."""
+        # APScheduler is only imported once a scheduler is actually started
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.triggers.cron import CronTrigger
+
         self._scheduler = BackgroundScheduler()
 
         world_interval = config.get("world_backup_interval", 1)
         server_interval = config.get("server_backup_interval", 6)
 
+        # Hours matched by the server backup cron trigger below
+        self._server_backup_hours = _backup_hours(server_interval)
+
         # Schedule world backups (every N hours at :00)
         self._scheduler.add_job(
             self._world_backup_job,
             CronTrigger(hour=f"*/{world_interval}", minute=0),
             id="world_backup",
             name="World Backup",
+            coalesce=True,
+            misfire_grace_time=BACKUP_MISFIRE_GRACE_TIME,
         )
 
         # Schedule server backups (every N hours at :00)
@@ -114,47 +167,117 @@ class VSMScheduler:
             CronTrigger(hour=f"*/{server_interval}", minute=0),
             id="server_backup",
             name="Server Backup",
+            coalesce=True,
+            misfire_grace_time=BACKUP_MISFIRE_GRACE_TIME,
         )
 
-        # Schedule announcements
-        self._schedule_next_announcements()
-
-        # Re-schedule announcements after each server backup
+        # Announce in the hour before each server backup, at the minutes that
+        # are ANNOUNCEMENT_INTERVALS before it
+        announce_hours = sorted((h - 1) % 24 for h in self._server_backup_hours)
+        announce_minutes = sorted(60 - m for m in ANNOUNCEMENT_INTERVALS)
         self._scheduler.add_job(
-            self._schedule_next_announcements,
-            CronTrigger(hour=f"*/{server_interval}", minute=1),
-            id="reschedule_announcements",
-            name="Reschedule Announcements",
+            self._announcement_job,
+            CronTrigger(
+                hour=",".join(map(str, announce_hours)),
+                minute=",".join(map(str, announce_minutes)),
+            ),
+            id="announcements",
+            name="Backup Announcements",
         )
 
         self._scheduler.start()
-        self._log("Scheduler started")
 
-    def stop(self) -> None:
-        """Stop the scheduler."""
-        if self._scheduler is not None:
-            self._scheduler.shutdown(wait=False)
-            self._scheduler = None
-            self._log("Scheduler stopped")
+    def stop(self, wait: bool = False) -> None:
+        """
+        Stop the scheduler.
+
+        No new jobs start once this returns, but the scheduler lock is held
+        until running jobs finish, so another scheduler cannot start a backup
+        alongside one in progress. With wait=True, block until then; otherwise
+        the jobs finish on a background thread, which releases the lock.
+        """
+        scheduler = self._scheduler
+        if scheduler is None:
+            return
+        self._scheduler = None
+
+        if wait:
+            scheduler.shutdown(wait=True)
+            self._release_lock()
+        else:
+            scheduler.pause()
+            with self._state_lock:
+                self._draining = True
+            threading.Thread(
+                target=self._finish_stop, args=(scheduler,), daemon=True
+            ).start()
+        self._log("Scheduler stopped")
+
+    def _finish_stop(self, scheduler: "BackgroundScheduler") -> None:
+        """Wait for a stopped scheduler's running jobs, then release the lock."""
+        scheduler.shutdown(wait=True)
+        with self._state_lock:
+            self._release_lock()
+            self._draining = False
+
+    def _acquire_lock(self, config: dict) -> None:
+        """
+        Take an exclusive lock on the scheduler lock file.
+
+        The kernel releases the lock when the holding process exits, so a
+        crashed scheduler never leaves a stale lock behind.
+        """
+        if self._lock_fd is not None:
+            return
+
+        backups_path = get_server_backups_path(config)
+        backups_path.mkdir(parents=True, exist_ok=True)
+        fd = os.open(backups_path / LOCK_FILENAME, os.O_RDWR | os.O_CREAT, 0o644)
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise RuntimeError("Another scheduler is already running for this server")
+
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._lock_fd = fd
+
+    def _release_lock(self) -> None:
+        """Release the scheduler lock file, if held."""
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
 
     def _should_announce(self) -> bool:
         """Check if we should announce (only when players are online)."""
+        now = time.monotonic()
+        if self._player_count is not None:
+            fetched_at, players = self._player_count
+            # A recent count of 0 skips the lookup too, so an empty server
+            # costs one server.sh call for the 2m and 1m announcements
+            if now - fetched_at < PLAYER_COUNT_TTL:
+                return players > 0
+
         try:
             players = get_players(self._config)
-            return players > 0
         except Exception:
             return False
 
+        self._player_count = (now, players)
+        return players > 0
+
     def _send_announcement(self, minutes: int) -> None:
         """Send a backup announcement to players."""
         if not self._should_announce():
             return
 
         downtime_estimate = format_downtime_estimate(self._config)
-        if minutes == 1:
-            message = f"Server going offline for backup in 1 minute {downtime_estimate}".strip()
-        else:
-            message = f"Server going offline for backup in {minutes} minutes {downtime_estimate}".strip()
+        unit = "minute" if minutes == 1 else "minutes"
+        message = f"Server going offline for backup in {minutes} {unit}"
+        if downtime_estimate:
+            message = f"{message} {downtime_estimate}"
 
         try:
             announce(message, self._config)
@@ -164,10 +287,7 @@ class VSMScheduler:
 
     def _world_backup_job(self) -> None:
         """World backup job that skips when server backup is in same hour."""
-        current_hour = datetime.now().hour
-        server_interval = self._config.get("server_backup_interval", 6) if self._config else 6
-
-        if current_hour % server_interval == 0:
+        if datetime.now().hour in self._server_backup_hours:
             self._log("Skipping world backup (server backup scheduled this hour)")
             return
 
@@ -189,7 +309,7 @@ class VSMScheduler:
 
         try:
             # Record stop time and stop server
-            record_stop_time(self._config)
+            record_stop_time(self._config).add_done_callback(self._check_downtime_write)
             self._log("Stopping server...")
             stop(self._config)
 
@@ -198,20 +318,24 @@ class VSMScheduler:
             result = server_backup(self._config)
             self._log(result)
 
-            # Cleanup
+            # Cleanup and pruning touch separate directories, so run them together
             self._log("Cleaning up old data...")
-            cleanup_result = cleanup_after_server_backup(self._config)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                cleanup_future = pool.submit(cleanup_after_server_backup, self._config)
+                prune_future = pool.submit(prune_old_backups, self._config)
+                cleanup_result = cleanup_future.result()
+                prune_result = prune_future.result()
+
             if cleanup_result:
                 self._log(cleanup_result)
-
-            # Prune old backups
-            prune_result = prune_old_backups(self._config)
             self._log(prune_result)
 
             # Restart server
             self._log("Starting server...")
             start(self._config)
-            record_start_time(self._config)
+            record_start_time(self._config).add_done_callback(
+                self._check_downtime_write
+            )
 
             self._log("Server backup cycle complete")
 
@@ -224,44 +348,20 @@ class VSMScheduler:
             except Exception:
                 pass
 
-    def _schedule_next_announcements(self) -> None:
-        """Schedule announcements before the next server backup."""
-        if self._scheduler is None or self._config is None:
-            return
+    def _check_downtime_write(self, future: Future) -> None:
+        """Log a failed background write of the downtime file."""
+        error = future.exception()
+        if error is not None:
+            self._log(f"Failed to save downtime data: {error}")
 
-        server_interval = self._config.get("server_backup_interval", 6)
+    def _announcement_job(self) -> None:
+        """Announce the upcoming server backup with the time left until it."""
         now = datetime.now()
-
-        # Calculate next server backup time
-        current_hour = now.hour
-        next_backup_hour = ((current_hour // server_interval + 1) * server_interval) % 24
-
-        if next_backup_hour <= current_hour:
-            next_backup = now.replace(
-                hour=next_backup_hour, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-        else:
-            next_backup = now.replace(
-                hour=next_backup_hour, minute=0, second=0, microsecond=0
-            )
-
-        # Remove old announcement jobs
-        for job in self._scheduler.get_jobs():
-            if job.id.startswith("announce_"):
-                job.remove()
-
-        # Schedule new announcements
-        for minutes in ANNOUNCEMENT_INTERVALS:
-            announce_time = next_backup - timedelta(minutes=minutes)
-            if announce_time > now:
-                self._scheduler.add_job(
-                    self._send_announcement,
-                    "date",
-                    run_date=announce_time,
-                    args=[minutes],
-                    id=f"announce_{minutes}",
-                    name=f"Announce {minutes}m",
-                )
+        next_backup = now.replace(minute=0, second=0, microsecond=0) + timedelta(
+            hours=1
+        )
+        minutes = round((next_backup - now).total_seconds() / 60)
+        self._send_announcement(minutes)
 
 
 def get_scheduler() -> VSMScheduler:
@@ -273,7 +373,7 @@ def get_scheduler() -> VSMScheduler:
 def run_scheduler() -> None:
     """Run the backup scheduler (blocking mode for CLI)."""
     import signal
-    import sys
+    import threading
     from rich.console import Console
 
     console = Console()
@@ -287,20 +387,30 @@ def run_scheduler() -> None:
     console.print(f"Server backup interval: every {config.get('server_backup_interval', 6)} hour(s)")
     console.print("Press Ctrl+C to stop\n")
 
-    scheduler.start(config)
+    try:
+        scheduler.start(config)
+    except RuntimeError as e:
+        console.print(f"[red]{e}[/red]")
+        return
+
+    # Jobs run on APScheduler's background thread; the main thread only has to
+    # block until a shutdown signal arrives, so wait on an event instead of polling
+    shutdown_event = threading.Event()
 
     def shutdown(signum, frame):
-        console.print("\n[yellow]Shutting down scheduler...[/yellow]")
-        scheduler.stop()
-        sys.exit(0)
+        # A second Ctrl+C interrupts the wait for a running backup
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        shutdown_event.set()
 
     signal.signal(signal.SIGINT, shutdown)
     signal.signal(signal.SIGTERM, shutdown)
 
     try:
-        # Keep main thread alive
-        import time
-        while True:
-            time.sleep(1)
-    except (KeyboardInterrupt, SystemExit):
+        shutdown_event.wait()
+        console.print("\n[yellow]Shutting down scheduler...[/yellow]")
+        # Let a backup that is already running finish before exiting
+        scheduler.stop(wait=True)
+    except KeyboardInterrupt:
+        console.print("[red]Forced exit, a running backup may be incomplete[/red]")
+    finally:
         scheduler.stop()
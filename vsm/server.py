@@ -6,6 +6,15 @@ from dataclasses import dataclass
 
 from .config import get_server_executable, load_config
 
+# Status fields in raw server.sh output, found in a single scan. Bytes are
+# matched so only the captured values ever need decoding.
+_STATUS_FIELD_RE = re.compile(
+    rb"(Version|Uptime|Players online|Memory usage Managed/Total):[ \t]*([^\r\n]*)"
+)
+
+# Player lines from "list clients" (format: [id] PlayerName IP:Port)
+_PLAYER_LINE_RE = re.compile(rb"^\[\d+\]\s+\S+\s+\S+:\d+\r?$", re.MULTILINE)
+
 
 @dataclass
 class ServerStatus:
@@ -20,8 +29,8 @@ class ServerStatus:
     memory_total: str | None = None
 
 
-def _run_server_command(args: list[str], config: dict | None = None) -> str:
-    """Run a server.sh command and return the output."""
+def _run_server_command_raw(args: list[str], config: dict | None = None) -> bytes:
+    """Run a server.sh command and return the undecoded output."""
     if config is None:
         config = load_config()
 
@@ -30,13 +39,37 @@ def _run_server_command(args: list[str], config: dict | None = None) -> str:
     if not server_sh.exists():
         raise FileNotFoundError(f"Server executable not found: {server_sh}")
 
+    # stderr is merged into stdout by the pipe, so output keeps its order
     result = subprocess.run(
         [str(server_sh)] + args,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
     )
 
-    return result.stdout + result.stderr
+    return result.stdout
+
+
+def _run_server_command(args: list[str], config: dict | None = None) -> str:
+    """Run a server.sh command and return the output."""
+    output = _run_server_command_raw(args, config)
+    # Normalize newlines the way text-mode pipes do
+    text = output.decode("utf-8", "replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _decode(value: bytes) -> str:
+    """Decode a captured piece of server.sh output."""
+    return value.decode("utf-8", "replace")
+
+
+def _split_pair(value: bytes) -> tuple[bytes, bytes]:
+    """Split an "a / b" status value into its first words, or empty bytes."""
+    left, sep, right = value.partition(b"/")
+    left_parts = left.split()
+    right_parts = right.split()
+    if not sep or not left_parts or not right_parts:
+        return b"", b""
+    return left_parts[-1], right_parts[0]
 
 
 def start(config: dict | None = None) -> str:
@@ -56,38 +89,42 @@ def restart(config: dict | None = None) -> str:
 
 def status(config: dict | None = None) -> ServerStatus:
     """Get the server status by running server.sh status and parsing output."""
-    output = _run_server_command(["status"], config)
+    output = _run_server_command_raw(["status"], config)
 
     # Check if server is running
-    running = "is up and running" in output
+    running = b"is up and running" in output
 
     if not running:
         return ServerStatus(running=False)
 
+    # Keep the first value seen for each field
+    fields: dict[bytes, bytes] = {}
+    for match in _STATUS_FIELD_RE.finditer(output):
+        fields.setdefault(match.group(1), match.group(2).strip())
+
     # Parse version
-    version_match = re.search(r"Version:\s*(\S+)", output)
-    version = version_match.group(1) if version_match else None
+    version_parts = fields.get(b"Version", b"").split()
+    version = _decode(version_parts[0]) if version_parts else None
 
     # Parse uptime
-    uptime_match = re.search(r"Uptime:\s*(.+?)(?:\n|$)", output)
-    uptime = uptime_match.group(1).strip() if uptime_match else None
-
-    # Parse players
-    players_match = re.search(r"Players online:\s*(\d+)\s*/\s*(\d+)", output)
-    if players_match:
-        players_online = int(players_match.group(1))
-        max_players = int(players_match.group(2))
+    uptime = _decode(fields[b"Uptime"]) if fields.get(b"Uptime") else None
+
+    # Parse players ("online / max")
+    players_online, max_players = _split_pair(fields.get(b"Players online", b""))
+    if players_online.isdigit() and max_players.isdigit():
+        players_online = int(players_online)
+        max_players = int(max_players)
     else:
         players_online = 0
         max_players = 0
 
-    # Parse memory
-    memory_match = re.search(
-        r"Memory usage Managed/Total:\s*(\S+)\s*/\s*(\S+)", output
+    # Parse memory ("managed / total")
+    memory_managed, memory_total = _split_pair(
+        fields.get(b"Memory usage Managed/Total", b"")
     )
-    if memory_match:
-        memory_managed = memory_match.group(1)
-        memory_total = memory_match.group(2)
+    if memory_managed and memory_total:
+        memory_managed = _decode(memory_managed)
+        memory_total = _decode(memory_total)
     else:
         memory_managed = None
         memory_total = None
@@ -110,11 +147,10 @@ def command(cmd: str, config: dict | None = None) -> str:
 
 def get_players(config: dict | None = None) -> int:
     """Get the number of players currently online by running 'list clients'."""
-    output = command("list clients", config)
+    output = _run_server_command_raw(["command", "list clients"], config)
 
-    # Count player lines (format: [id] PlayerName IP:Port)
-    player_lines = re.findall(r"^\[\d+\]\s+\S+\s+\S+:\d+$", output, re.MULTILINE)
-    return len(player_lines)
+    # Count player lines without building a list of them
+    return sum(1 for _ in _PLAYER_LINE_RE.finditer(output))
 
 
 def announce(message: str, config: dict | None = None) -> str:
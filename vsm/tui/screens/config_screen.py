@@ -6,7 +6,8 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Static
 
 from ...config import load_config, save_config, get_config_path
-from .edit_value_screen import EditValueScreen
+from ..workers import run_blocking
+from .edit_value_screen import EditValueScreen, coerce_value
 
 
 class ConfigScreen(ModalScreen):
@@ -19,8 +20,10 @@ class ConfigScreen(ModalScreen):
 
     def __init__(self) -> None:
         super().__init__()
-        self.config = load_config()
-        self.original_config = self.config.copy()
+        # Loaded in on_mount, so pushing the screen never waits on disk
+        self.config: dict = {}
+        # Row order of the table, rebuilt whenever it is repopulated
+        self._keys: list[str] = []
 
     def compose(self) -> ComposeResult:
         """Create the config dialog layout."""
@@ -33,19 +36,23 @@ class ConfigScreen(ModalScreen):
                 yield Button("Save", id="save-btn", variant="success")
                 yield Button("Cancel", id="cancel-btn", variant="default")
 
-    def on_mount(self) -> None:
-        """Initialize the config table."""
+    async def on_mount(self) -> None:
+        """Load the config and initialize the config table."""
         table = self.query_one("#config-table", DataTable)
-        table.add_columns("Setting", "Value")
+        _, self._value_column = table.add_columns("Setting", "Value")
         table.cursor_type = "row"
+        self.config = await run_blocking(load_config)
         self._populate_table()
 
     def _populate_table(self) -> None:
         """Populate the config table with current values."""
         table = self.query_one("#config-table", DataTable)
         table.clear()
-        for key, value in self.config.items():
-            table.add_row(key, str(value), key=key)
+        self._keys = list(self.config)
+        # Add every row before the screen refreshes
+        with self.app.batch_update():
+            for key, value in self.config.items():
+                table.add_row(key, str(value), key=key)
 
     def _open_edit_modal(self, key: str) -> None:
         """Open the edit modal for a config value."""
@@ -53,28 +60,25 @@ class ConfigScreen(ModalScreen):
 
         def handle_edit_result(new_value: str | None) -> None:
             if new_value is not None:
-                old_value = self.config[key]
                 # Try to preserve the original type
-                if isinstance(old_value, int):
-                    try:
-                        new_value = int(new_value)
-                    except ValueError:
-                        pass
-                elif isinstance(old_value, float):
-                    try:
-                        new_value = float(new_value)
-                    except ValueError:
-                        pass
+                new_value = coerce_value(new_value, self.config[key])
                 self.config[key] = new_value
-                self._populate_table()
+                # Only this row changed, so update its cell in place
+                table = self.query_one("#config-table", DataTable)
+                table.update_cell(
+                    key, self._value_column, str(new_value), update_width=True
+                )
 
         self.app.push_screen(EditValueScreen(key, current_value), handle_edit_result)
 
     def action_edit_selected(self) -> None:
         """Edit the currently selected row."""
+        if not self.config:
+            return
+
         table = self.query_one("#config-table", DataTable)
         if table.cursor_row is not None:
-            key = list(self.config.keys())[table.cursor_row]
+            key = self._keys[table.cursor_row]
             self._open_edit_modal(key)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
@@ -82,11 +86,13 @@ class ConfigScreen(ModalScreen):
         if event.row_key and event.row_key.value:
             self._open_edit_modal(str(event.row_key.value))
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "save-btn":
-            save_config(self.config)
-            self.app.notify("Configuration saved")
+            # Nothing to save if the config has not finished loading
+            if self.config:
+                await run_blocking(save_config, self.config)
+                self.app.notify("Configuration saved")
             self.dismiss()
         elif event.button.id == "cancel-btn":
             self.dismiss()
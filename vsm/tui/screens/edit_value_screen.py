@@ -6,6 +6,32 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Static
 
 
+def _to_int(raw: str) -> int | str:
+    """Convert to int, or return the string unchanged if it is not one."""
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
+
+
+def _to_float(raw: str) -> float | str:
+    """Convert to float, or return the string unchanged if it is not one."""
+    try:
+        return float(raw)
+    except ValueError:
+        return raw
+
+
+# Converters keyed by the type of the value being replaced (bool is an int)
+_CONVERTERS = {int: _to_int, bool: _to_int, float: _to_float}
+
+
+def coerce_value(raw: str, original):
+    """Convert an edited string to the type of the value it replaces, if possible."""
+    converter = _CONVERTERS.get(type(original))
+    return converter(raw) if converter else raw
+
+
 class EditValueScreen(ModalScreen[str | None]):
     """Modal screen for editing a single config value."""
 
@@ -9,7 +9,28 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Static
 
 from ...config import load_config, get_data_path
-from .edit_value_screen import EditValueScreen
+from ..workers import run_blocking
+from .edit_value_screen import EditValueScreen, coerce_value
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Display markup for values that are not shown as plain text
+_NULL_MARKUP = "[dim]null[/dim]"
+_TRUE_MARKUP = "[green]true[/green]"
+_FALSE_MARKUP = "[red]false[/red]"
+_DICT_MARKUP = "[dim]{...}[/dim]"
+
+# Display formatters keyed by JSON value type; complex nested structures are
+# summarized for cleaner display
+_FORMATTERS = {
+    type(None): lambda value: _NULL_MARKUP,
+    bool: lambda value: _TRUE_MARKUP if value else _FALSE_MARKUP,
+    dict: lambda value: _DICT_MARKUP,
+    list: lambda value: f"[dim][{len(value)} items][/dim]",
+}
 
 
 def get_server_config_path() -> Path:
@@ -18,22 +39,34 @@ def get_server_config_path() -> Path:
     return get_data_path(config) / "serverconfig.json"
 
 
-def load_server_config() -> dict:
-    """Load server configuration from serverconfig.json."""
-    config_path = get_server_config_path()
+def load_server_config(config_path: Path | None = None) -> dict:
+    """
+    Load server configuration from serverconfig.json.
 
-    if not config_path.exists():
-        return {}
+    The file is parsed on every call: re-parsing it is cheaper than deep
+    copying a cached result, which callers would need since they edit it.
+    """
+    if config_path is None:
+        config_path = get_server_config_path()
 
-    with open(config_path, "r") as f:
-        return json.load(f)
+    try:
+        data = config_path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
-def save_server_config(config: dict) -> None:
+def save_server_config(config: dict, config_path: Path | None = None) -> None:
     """Save server configuration to serverconfig.json."""
-    config_path = get_server_config_path()
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    if config_path is None:
+        config_path = get_server_config_path()
+
+    # Serialize up front and write the file in one call
+    if orjson is not None:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(config, indent=2).encode()
+    config_path.write_bytes(data)
 
 
 class ServerConfigScreen(ModalScreen):
@@ -46,8 +79,12 @@ class ServerConfigScreen(ModalScreen):
 
     def __init__(self) -> None:
         super().__init__()
-        self.config = load_server_config()
-        self.original_config = self.config.copy()
+        # Resolved and loaded in on_mount, so pushing the screen never waits
+        # on disk; the path is reused for display, load and save
+        self.config_path: Path | None = None
+        self.config: dict = {}
+        # Row order of the table, rebuilt whenever it is repopulated
+        self._keys: list[str] = []
         # Track which keys are editable (not dicts/lists)
         self.editable_keys: list[str] = []
 
@@ -55,52 +92,57 @@ class ServerConfigScreen(ModalScreen):
         """Create the server config dialog layout."""
         with Vertical(id="server-config-dialog"):
             yield Static("Server Configuration", classes="title")
-            yield Static(f"[dim]{get_server_config_path()}[/dim]")
+            yield Static("", id="server-config-path")
             yield Static("[dim]Press Enter to edit, Escape to cancel[/dim]", id="server-config-help")
             yield DataTable(id="server-config-table")
             with Horizontal(id="server-config-buttons"):
                 yield Button("Save", id="save-btn", variant="success")
                 yield Button("Cancel", id="cancel-btn", variant="default")
 
-    def on_mount(self) -> None:
-        """Initialize the config table."""
+    async def on_mount(self) -> None:
+        """Load the server config and initialize the config table."""
         table = self.query_one("#server-config-table", DataTable)
-        table.add_columns("Setting", "Value")
+        _, self._value_column = table.add_columns("Setting", "Value")
         table.cursor_type = "row"
+        self.config_path = await run_blocking(get_server_config_path)
+        self.query_one("#server-config-path", Static).update(
+            f"[dim]{self.config_path}[/dim]"
+        )
+        self.config = await run_blocking(load_server_config, self.config_path)
         self._populate_table()
 
     def _populate_table(self) -> None:
         """Populate the config table with current values."""
         table = self.query_one("#server-config-table", DataTable)
         table.clear()
+        self._keys = list(self.config)
         self.editable_keys = []
 
         if not self.config:
             table.add_row("[dim]No config found[/dim]", "[dim]--[/dim]")
             return
 
-        # Show key settings, skip complex nested objects for display
-        for key, value in self.config.items():
-            # Skip complex nested structures for cleaner display
-            if isinstance(value, (dict, list)):
-                if isinstance(value, list):
-                    display_value = f"[dim][{len(value)} items][/dim]"
-                else:
-                    display_value = "[dim]{...}[/dim]"
-                # Not editable
-            elif value is None:
-                display_value = "[dim]null[/dim]"
-                self.editable_keys.append(key)
-            elif isinstance(value, bool):
-                display_value = "[green]true[/green]" if value else "[red]false[/red]"
-                self.editable_keys.append(key)
-            else:
-                display_value = str(value)
-                # Truncate long values for display
-                if len(display_value) > 50:
-                    display_value = display_value[:47] + "..."
-                self.editable_keys.append(key)
-            table.add_row(key, display_value, key=key)
+        # Show key settings, skip complex nested objects for display. Every row
+        # is added before the screen refreshes.
+        with self.app.batch_update():
+            for key, value in self.config.items():
+                # Complex nested structures are summarized and not editable
+                if not isinstance(value, (dict, list)):
+                    self.editable_keys.append(key)
+                table.add_row(key, self._format_value(value), key=key)
+
+    @staticmethod
+    def _format_value(value) -> str:
+        """Format a config value for display in the table."""
+        formatter = _FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+
+        display_value = str(value)
+        # Truncate long values for display
+        if len(display_value) > 50:
+            display_value = display_value[:47] + "..."
+        return display_value
 
     def _get_raw_value(self, key: str) -> str:
         """Get the raw value for editing (not formatted for display)."""
@@ -124,20 +166,8 @@ class ServerConfigScreen(ModalScreen):
         if raw.lower() in ("true", "false"):
             return raw.lower() == "true"
 
-        # Try to preserve the original type
-        if isinstance(original_value, int):
-            try:
-                return int(raw)
-            except ValueError:
-                pass
-        elif isinstance(original_value, float):
-            try:
-                return float(raw)
-            except ValueError:
-                pass
-
-        # Default to string
-        return raw
+        # Try to preserve the original type, defaulting to string
+        return coerce_value(raw, original_value)
 
     def _open_edit_modal(self, key: str) -> None:
         """Open the edit modal for a config value."""
@@ -152,7 +182,14 @@ class ServerConfigScreen(ModalScreen):
                 original_value = self.config[key]
                 parsed_value = self._parse_value(new_value, original_value)
                 self.config[key] = parsed_value
-                self._populate_table()
+                # Only this row changed, so update its cell in place
+                table = self.query_one("#server-config-table", DataTable)
+                table.update_cell(
+                    key,
+                    self._value_column,
+                    self._format_value(parsed_value),
+                    update_width=True,
+                )
 
         self.app.push_screen(EditValueScreen(key, current_value), handle_edit_result)
 
@@ -163,7 +200,7 @@ class ServerConfigScreen(ModalScreen):
 
         table = self.query_one("#server-config-table", DataTable)
         if table.cursor_row is not None:
-            key = list(self.config.keys())[table.cursor_row]
+            key = self._keys[table.cursor_row]
             self._open_edit_modal(key)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
@@ -171,11 +208,11 @@ class ServerConfigScreen(ModalScreen):
         if event.row_key and event.row_key.value:
             self._open_edit_modal(str(event.row_key.value))
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "save-btn":
             if self.config:
-                save_server_config(self.config)
+                await run_blocking(save_server_config, self.config, self.config_path)
                 self.app.notify("Server configuration saved")
             self.dismiss()
         elif event.button.id == "cancel-btn":
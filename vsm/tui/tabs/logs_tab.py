@@ -1,7 +1,11 @@
 """Logs tab for VSM TUI."""
 
+import asyncio
+import os
 from pathlib import Path
+from typing import BinaryIO
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.widgets import Button, RichLog, Select
@@ -9,6 +13,23 @@ from textual.widgets import Button, RichLog, Select
 from ...config import get_logs_path, load_config
 from ..workers import run_blocking
 
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+# Seconds between checks when file change notifications are unavailable
+POLL_INTERVAL = 0.5
+
+# Bytes read per step when loading a log file, yielding to the UI in between
+READ_CHUNK_SIZE = 64 * 1024
+
+# Only this much of the end of a large log is loaded when it is selected
+INITIAL_TAIL_BYTES = 256 * 1024
+
+# Lines kept in the log viewer before the oldest are dropped
+MAX_LOG_LINES = 10_000
+
 
 def _get_active_log_files(logs_path: Path) -> list[Path]:
     """Get list of active (non-archived) log files."""
@@ -30,6 +51,19 @@ class LogsTab(Container):
         self._log_files: list[Path] = []
         self._following = True
         self._in_block = False
+        # Trailing bytes of the selected file that do not yet end in a newline
+        self._pending = b""
+        # Set when loading starts mid-line and the first partial line is dropped
+        self._skip_partial_line = False
+        # Handle kept open on the selected log between reads, and its inode
+        self._handle: BinaryIO | None = None
+        self._handle_ino: int | None = None
+        # Notifications for the logs folder, or None when polling
+        self._inotify = None
+        # True while a worker is reading; polls meanwhile set _changed so it
+        # reads again instead of being cancelled and restarted
+        self._reading = False
+        self._changed = False
 
     def compose(self) -> ComposeResult:
         """Create the logs tab layout."""
@@ -42,23 +76,92 @@ class LogsTab(Container):
             )
             yield Button("Clear", id="btn-clear")
             yield Button("Pause", id="btn-pause")
-        yield RichLog(id="log-viewer", highlight=True, markup=True)
+        # Log lines are written as Text, so markup parsing and highlighting
+        # never run over raw log content
+        yield RichLog(
+            id="log-viewer", highlight=False, markup=False, max_lines=MAX_LOG_LINES
+        )
 
     def on_mount(self) -> None:
         """Initialize log viewer."""
         self._init_logs()
-        self.set_interval(0.5, self._poll_logs)
+        self._inotify = self._watch_logs()
+        if self._inotify is None:
+            self.set_interval(POLL_INTERVAL, self._poll_logs)
+
+    def on_unmount(self) -> None:
+        """Stop watching the logs folder and close the open log."""
+        if self._inotify is not None:
+            asyncio.get_running_loop().remove_reader(self._inotify.fileno())
+            self._inotify.close()
+            self._inotify = None
+        self._close_handle()
+
+    def _close_handle(self) -> None:
+        """Close the handle on the selected log, if one is open."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            self._handle_ino = None
+
+    def _watch_logs(self):
+        """
+        Watch the logs folder for writes using inotify.
+
+        Returns None when inotify_simple is not installed or the watch cannot be
+        added, in which case the caller falls back to polling.
+        """
+        if INotify is None:
+            return None
+
+        logs_path = get_logs_path(load_config())
+        try:
+            inotify = INotify()
+        except OSError:
+            return None
+        try:
+            inotify.add_watch(logs_path, flags.MODIFY | flags.CREATE | flags.MOVED_TO)
+        except OSError:
+            inotify.close()
+            return None
+
+        asyncio.get_running_loop().add_reader(inotify.fileno(), self._on_log_events)
+        return inotify
+
+    def _on_log_events(self) -> None:
+        """Drain pending inotify events and read any new log content."""
+        self._inotify.read(timeout=0)
+        self._poll_logs()
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle log file selection change."""
         log_viewer = self.query_one("#log-viewer", RichLog)
         log_viewer.clear()
         self._in_block = False  # Reset filter state
+        self._pending = b""
+        self._skip_partial_line = False
+        self._close_handle()
         if event.value:
             selected_file = Path(str(event.value))
-            # Reset file position for the newly selected file to 0 for full initial load
-            self._file_positions[selected_file] = 0
-            self._poll_logs()
+            # Load the newly selected file from the start, or only its tail if
+            # it is large
+            start_pos = 0
+            try:
+                size = selected_file.stat().st_size
+            except OSError:
+                size = 0
+            if size > INITIAL_TAIL_BYTES:
+                start_pos = size - INITIAL_TAIL_BYTES
+                self._skip_partial_line = True
+                log_viewer.write(
+                    Text(
+                        f"... showing last {INITIAL_TAIL_BYTES // 1024} KB ...",
+                        style="dim",
+                    )
+                )
+            self._file_positions[selected_file] = start_pos
+            if self._following:
+                self._read_logs()
 
     def _init_logs(self) -> None:
         """Initialize log file tracking."""
@@ -77,20 +180,58 @@ class LogsTab(Container):
         if options:
             select.set_options(options)
             select.value = str(self._log_files[0])
-            log_viewer.write("[dim]Watching log files...[/dim]")
+            log_viewer.write(Text("Watching log files...", style="dim"))
         else:
             # No log files found - keep the placeholder and show a message
-            log_viewer.write("[yellow]No log files found. Start the server to generate logs.[/yellow]")
+            log_viewer.write(
+                Text(
+                    "No log files found. Start the server to generate logs.",
+                    style="yellow",
+                )
+            )
 
     def _poll_logs(self) -> None:
         """Poll for new log content."""
         if not self._following:
             return
 
+        # A running read continues to EOF, so just have it check once more
+        if self._reading:
+            self._changed = True
+            return
+
+        # Only start a worker when the selected file's size has changed
+        selected = self.query_one("#log-select", Select).value
+        if not selected:
+            return
+        log_file = Path(str(selected))
+        try:
+            size = log_file.stat().st_size
+        except OSError:
+            return
+        if size == self._file_positions.get(log_file, 0):
+            return
+
+        self._read_logs()
+
+    def _read_logs(self) -> None:
+        """Start reading the selected log, replacing any read in progress."""
         self.run_worker(self._read_new_content(), exclusive=True)
 
     async def _read_new_content(self) -> None:
         """Read new content from log files."""
+        self._reading = True
+        try:
+            while True:
+                self._changed = False
+                await self._read_selected_file()
+                if not self._changed:
+                    break
+        finally:
+            self._reading = False
+
+    async def _read_selected_file(self) -> None:
+        """Read the selected log file from its saved position to EOF."""
         select = self.query_one("#log-select", Select)
         selected = select.value
         log_viewer = self.query_one("#log-viewer", RichLog)
@@ -104,47 +245,86 @@ class LogsTab(Container):
                 continue
 
             try:
-                current_size = log_file.stat().st_size
+                st = log_file.stat()
+                current_size = st.st_size
                 last_pos = self._file_positions.get(log_file, 0)
 
-                if current_size > last_pos:
-                    content = await run_blocking(
-                        self._read_file_chunk, log_file, last_pos
-                    )
-                    if content:
-                        prefix = f"[cyan][{log_file.stem}][/cyan] "
-                        is_server_main = log_file.stem.lower() == "server-main"
-
-                        for line in content.splitlines():
-                            if not line.strip():
-                                continue
-
-                            # State machine for server-main.log
-                            if is_server_main:
-                                line_lower = line.lower()
-                                if self._in_block:
-                                    if "network udp:" in line_lower:
-                                        self._in_block = False
-                                    continue  # Discard line
-                                elif "handling console command /stats" in line_lower:
-                                    self._in_block = True
-                                    continue  # Discard line
-                            
-                            log_viewer.write(f"{prefix}{line}")
-
-                    self._file_positions[log_file] = current_size
-                elif current_size < last_pos:
-                    # File was truncated, reset position
+                if current_size < last_pos:
+                    # File was truncated: read it again from the start now,
+                    # since no further change event may arrive for this write
+                    last_pos = 0
                     self._file_positions[log_file] = 0
+                    self._pending = b""
+                    self._skip_partial_line = False
+                    self._in_block = False
+
+                # Keep one handle open across reads; reopen only when the
+                # path now refers to a different file
+                if self._handle is None or self._handle_ino != st.st_ino:
+                    self._close_handle()
+                    self._handle = await run_blocking(open, log_file, "rb", buffering=0)
+                    self._handle_ino = st.st_ino
+
+                # Read in chunks so a large file never blocks the UI for long;
+                # the position is saved per chunk, so a cancelled read resumes.
+                # Reading to EOF also picks up anything appended meanwhile.
+                while True:
+                    chunk = await run_blocking(
+                        self._read_file_chunk, self._handle, last_pos
+                    )
+                    if not chunk:
+                        break
+                    last_pos += len(chunk)
+                    self._write_chunk(log_viewer, log_file, chunk)
+                    self._file_positions[log_file] = last_pos
+                    await asyncio.sleep(0)
             except Exception:
                 pass
 
+    def _write_chunk(self, log_viewer: RichLog, log_file: Path, chunk: bytes) -> None:
+        """Write the complete lines in a chunk, holding back any partial line."""
+        data = self._pending + chunk
+        if self._skip_partial_line:
+            # Drop the line the tail window started in the middle of
+            _, sep, data = data.partition(b"\n")
+            if not sep:
+                self._pending = b""
+                return
+            self._skip_partial_line = False
+
+        data, sep, self._pending = data.rpartition(b"\n")
+        if not sep:
+            return
+
+        prefix = (f"[{log_file.stem}] ", "cyan")
+        is_server_main = log_file.stem.lower() == "server-main"
+
+        for line in data.decode("utf-8", errors="replace").splitlines():
+            if not line.strip():
+                continue
+
+            # State machine for server-main.log
+            if is_server_main:
+                line_lower = line.lower()
+                if self._in_block:
+                    if "network udp:" in line_lower:
+                        self._in_block = False
+                    continue  # Discard line
+                elif "handling console command /stats" in line_lower:
+                    self._in_block = True
+                    continue  # Discard line
+
+            log_viewer.write(Text.assemble(prefix, line))
+
     @staticmethod
-    def _read_file_chunk(file_path: Path, start_pos: int) -> str:
-        """Read a chunk of a file from a given position."""
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            f.seek(start_pos)
-            return f.read()
+    def _read_file_chunk(handle: BinaryIO, start_pos: int) -> bytes:
+        """
+        Read up to READ_CHUNK_SIZE bytes of an open file from a given position.
+
+        pread leaves the shared file offset alone, so a read left running by a
+        cancelled worker cannot disturb the next one.
+        """
+        return os.pread(handle.fileno(), READ_CHUNK_SIZE, start_pos)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -155,3 +335,6 @@ class LogsTab(Container):
             self._following = not self._following
             btn = self.query_one("#btn-pause", Button)
             btn.label = "Resume" if not self._following else "Pause"
+            if self._following:
+                # Catch up on anything written while paused
+                self._poll_logs()
@@ -1,6 +1,6 @@
 """Scheduler tab for VSM TUI."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
@@ -39,6 +39,16 @@ class StatusTab(Container):
 
     def on_mount(self) -> None:
         """Start status refresh on mount."""
+        # Look the widgets up once; every refresh updates the same ones
+        self._running_label = self.query_one("#status-running", Static)
+        self._version_label = self.query_one("#status-version", Static)
+        self._uptime_label = self.query_one("#status-uptime", Static)
+        self._players_label = self.query_one("#status-players", Static)
+        self._memory_label = self.query_one("#status-memory", Static)
+        self._btn_start = self.query_one("#btn-start", Button)
+        self._btn_stop = self.query_one("#btn-stop", Button)
+        self._btn_restart = self.query_one("#btn-restart", Button)
+
         self.refresh_status()
         self.set_interval(5, self.refresh_status)
 
@@ -57,9 +67,7 @@ class StatusTab(Container):
             self._update_display()
         except Exception as e:
             self._status = None
-            self.query_one("#status-running", Static).update(
-                f"Status: [red]Error: {e}[/red]"
-            )
+            self._running_label.update(f"Status: [red]Error: {e}[/red]")
 
     def _update_display(self) -> None:
         """Update the status display."""
@@ -67,9 +75,9 @@ class StatusTab(Container):
             return
 
         s = self._status
-        btn_start = self.query_one("#btn-start", Button)
-        btn_stop = self.query_one("#btn-stop", Button)
-        btn_restart = self.query_one("#btn-restart", Button)
+        btn_start = self._btn_start
+        btn_stop = self._btn_stop
+        btn_restart = self._btn_restart
 
         # Check if server is fully running (has version, uptime, and memory)
         fully_running = (
@@ -77,58 +85,42 @@ class StatusTab(Container):
         )
 
         if self._restarting:
-            self.query_one("#status-running", Static).update(
-                "Status: [yellow]Restarting[/yellow]"
-            )
-            self.query_one("#status-version", Static).update("Version: [dim]--[/dim]")
-            self.query_one("#status-uptime", Static).update("Uptime: [dim]--[/dim]")
-            self.query_one("#status-players", Static).update("Players: [dim]--[/dim]")
-            self.query_one("#status-memory", Static).update("Memory: [dim]--[/dim]")
+            self._running_label.update("Status: [yellow]Restarting[/yellow]")
+            self._version_label.update("Version: [dim]--[/dim]")
+            self._uptime_label.update("Uptime: [dim]--[/dim]")
+            self._players_label.update("Players: [dim]--[/dim]")
+            self._memory_label.update("Memory: [dim]--[/dim]")
             btn_start.display = False
             btn_stop.display = False
             btn_restart.display = False
         elif self._stopping:
-            self.query_one("#status-running", Static).update(
-                "Status: [yellow]Stopping[/yellow]"
-            )
-            self.query_one("#status-version", Static).update("Version: [dim]--[/dim]")
-            self.query_one("#status-uptime", Static).update("Uptime: [dim]--[/dim]")
-            self.query_one("#status-players", Static).update("Players: [dim]--[/dim]")
-            self.query_one("#status-memory", Static).update("Memory: [dim]--[/dim]")
+            self._running_label.update("Status: [yellow]Stopping[/yellow]")
+            self._version_label.update("Version: [dim]--[/dim]")
+            self._uptime_label.update("Uptime: [dim]--[/dim]")
+            self._players_label.update("Players: [dim]--[/dim]")
+            self._memory_label.update("Memory: [dim]--[/dim]")
             btn_start.display = False
             btn_stop.display = False
             btn_restart.display = False
         elif fully_running:
             # Server is fully up and running
             self._starting = False
-            self.query_one("#status-running", Static).update(
-                "Status: [green]Running[/green]"
-            )
-            self.query_one("#status-version", Static).update(
-                f"Version: {s.version}"
-            )
-            self.query_one("#status-uptime", Static).update(
-                f"Uptime: {s.uptime}"
-            )
-            self.query_one("#status-players", Static).update(
-                f"Players: {s.players_online} / {s.max_players}"
-            )
-            self.query_one("#status-memory", Static).update(
-                f"Memory: {s.memory_managed} / {s.memory_total}"
-            )
+            self._running_label.update("Status: [green]Running[/green]")
+            self._version_label.update(f"Version: {s.version}")
+            self._uptime_label.update(f"Uptime: {s.uptime}")
+            self._players_label.update(f"Players: {s.players_online} / {s.max_players}")
+            self._memory_label.update(f"Memory: {s.memory_managed} / {s.memory_total}")
             # Server is running: show Stop and Restart, hide Start
             btn_start.display = False
             btn_stop.display = True
             btn_restart.display = True
         elif self._starting or (s and s.running and not fully_running):
             # Server is starting up
-            self.query_one("#status-running", Static).update(
-                "Status: [yellow]Starting[/yellow]"
-            )
-            self.query_one("#status-version", Static).update("Version: [dim]--[/dim]")
-            self.query_one("#status-uptime", Static).update("Uptime: [dim]--[/dim]")
-            self.query_one("#status-players", Static).update("Players: [dim]--[/dim]")
-            self.query_one("#status-memory", Static).update("Memory: [dim]--[/dim]")
+            self._running_label.update("Status: [yellow]Starting[/yellow]")
+            self._version_label.update("Version: [dim]--[/dim]")
+            self._uptime_label.update("Uptime: [dim]--[/dim]")
+            self._players_label.update("Players: [dim]--[/dim]")
+            self._memory_label.update("Memory: [dim]--[/dim]")
             # Server is starting: hide all buttons
             btn_start.display = False
             btn_stop.display = False
@@ -136,13 +128,11 @@ class StatusTab(Container):
         else:
             # Server is stopped
             self._starting = False
-            self.query_one("#status-running", Static).update(
-                "Status: [red]Stopped[/red]"
-            )
-            self.query_one("#status-version", Static).update("Version: --")
-            self.query_one("#status-uptime", Static).update("Uptime: --")
-            self.query_one("#status-players", Static).update("Players: --")
-            self.query_one("#status-memory", Static).update("Memory: --")
+            self._running_label.update("Status: [red]Stopped[/red]")
+            self._version_label.update("Version: --")
+            self._uptime_label.update("Uptime: --")
+            self._players_label.update("Players: --")
+            self._memory_label.update("Memory: --")
             # Server is stopped: show Start, hide Stop and Restart
             btn_start.display = True
             btn_stop.display = False
@@ -195,8 +185,6 @@ class StatusTab(Container):
         elif button_id == "btn-config":
             self.app.push_screen(ServerConfigScreen())
 
-
-
     def on_key(self, event: Key) -> None:
         """Handle key events for arrow navigation in controls."""
         focused = self.app.focused